@@ -11,16 +11,25 @@ Requires: pip install pymupdf
 Outputs: index.html, manifest.json, sw.js, icon.svg
 """
 
-import sys, json, os, time, re
+import sys, json, os, time, re, hashlib, gzip, multiprocessing
 import urllib.request, urllib.parse, urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from bisect import bisect_right
+from itertools import chain
 import fitz  # pymupdf
 
 
+_RE_SEITE_VON = re.compile(r'\s*Seite\s+\d+\s+von\s+\d+')
+_RE_SEITE = re.compile(r'\s*Seite\s+\d+')
+_RE_VON_END = re.compile(r'\s+von\s+\d+$')
+
+
 def clean_text(s):
     """Remove PDF page-footer artifacts like 'Seite 41 von 42'."""
-    s = re.sub(r'\s*Seite\s+\d+\s+von\s+\d+', '', s)
-    s = re.sub(r'\s*Seite\s+\d+', '', s)
-    s = re.sub(r'\s+von\s+\d+$', '', s)
+    s = _RE_SEITE_VON.sub('', s)
+    s = _RE_SEITE.sub('', s)
+    s = _RE_VON_END.sub('', s)
     return s.strip()
 
 
@@ -28,70 +37,104 @@ def clean_text(s):
 # PDF Parsing
 # ---------------------------------------------------------------------------
 
+# Question data is kept column-wise: one list per field, indexed by question.
+FIELDS_DE = ['question_de', 'ans_a_de', 'ans_b_de', 'ans_c_de']
+FIELDS_EN = ['question_en', 'ans_a_en', 'ans_b_en', 'ans_c_en']
+
+# Y-axis bands as [lo, hi) (page is rotated 90°; y decreases top→bottom)
+_BAND_Q = (410, 740)
+_BAND_A = (290, 410)
+_BAND_B = (175, 290)
+_BAND_C = (50, 175)
+# Contiguous band edges: bisect_right(_BAND_EDGES, y) gives 1=c, 2=b, 3=a, 4=q,
+# and 0 / 5 for words below / above all bands.
+_BAND_EDGES = (_BAND_C[0], _BAND_B[0], _BAND_A[0], _BAND_Q[0], _BAND_Q[1])
+
+
+def section_text(items):
+    """Join one band's words in reading order (sorts items in place)."""
+    # x asc, y desc for wraps: two stable sorts with C-level keys
+    # instead of building a (x, -y) tuple per word
+    items.sort(key=itemgetter(1), reverse=True)
+    items.sort(key=itemgetter(0))
+    return ' '.join([w[4] for w in items])
+
+
+def parse_page(page):
+    """Return (question, ans_a, ans_b, ans_c) German text tuples for one page."""
+    words_raw = page.get_text('words')
+    # Deduplicate by rounded (x0, y0); the PDF stores every word twice.
+    # Iterating in reverse lets the first occurrence win; order is not
+    # preserved, but words are re-sorted by x below anyway.
+    words = {(round(w[0]), round(w[1])): w for w in reversed(words_raw)}.values()
+
+    # Each question is a vertical column; find column x-origins via lfdNr row.
+    # Threshold x>40 (not 70) to also catch the last question on the final page
+    # which sits at x≈48 due to the rotated layout. Column header labels at x≈34
+    # use encoded text and are never all-digit, so they are safely excluded.
+    col_xs = sorted({
+        round(w[0]) for w in words
+        if 730 < w[1] < 760 and w[0] > 40 and w[4].isdigit()
+    })
+    if not col_xs:
+        return []
+
+    boundaries = col_xs + [col_xs[-1] + 100]
+
+    # Bucket words into columns and y-bands with one sweep in x order, so
+    # each word is compared against the column and band limits only once.
+    buckets = [([], [], [], [], [], []) for _ in col_xs]  # indexed by band
+    ci = 0
+    for w in sorted(words, key=lambda w: w[0]):
+        if w[0] < col_xs[0] - 1:
+            continue
+        while ci < len(col_xs) and w[0] >= boundaries[ci+1] - 1:
+            ci += 1
+        if ci == len(col_xs):
+            break
+        y = w[1]
+        band = bisect_right(_BAND_EDGES, y)
+        if band == 4 and y > 730 and w[4].isdigit():
+            continue  # Question text: skip the leading lfdNr digit at y≈739
+        buckets[ci][band].append(w)
+
+    questions = []
+    for _, cw, bw, aw, qw, _ in buckets:
+        q_text = section_text(qw).strip()
+        a = section_text(aw)
+        b = section_text(bw)
+        c = section_text(cw)
+
+        if q_text and a:
+            questions.append((clean_text(q_text), clean_text(a),
+                              clean_text(b), clean_text(c)))
+
+    return questions
+
+
+_worker_doc = None
+
+
+def _open_worker_doc(pdf_path):
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+
+
+def _parse_page_number(pg):
+    return parse_page(_worker_doc[pg])
+
+
 def parse_pdf(pdf_path):
-    doc = fitz.open(pdf_path)
-
-    def parse_page(page):
-        words_raw = page.get_text('words')
-        # Deduplicate by rounded (x0, y0)
-        seen = set()
-        words = []
-        for w in words_raw:
-            key = (round(w[0]), round(w[1]))
-            if key not in seen:
-                seen.add(key)
-                words.append(w)
-
-        # Each question is a vertical column; find column x-origins via lfdNr row.
-        # Threshold x>40 (not 70) to also catch the last question on the final page
-        # which sits at x≈48 due to the rotated layout. Column header labels at x≈34
-        # use encoded text and never match ^\d+$ so they are safely excluded.
-        col_xs = sorted(set(
-            round(w[0]) for w in words
-            if 730 < w[1] < 760 and w[0] > 40 and re.match(r'^\d+$', w[4])
-        ))
-        if not col_xs:
-            return []
-
-        boundaries = col_xs + [col_xs[-1] + 100]
-
-        # Y-axis bands (page is rotated 90°; y decreases top→bottom)
-        Y = {'q': (410, 740), 'a': (290, 410), 'b': (175, 290), 'c': (50, 175)}
-
-        def section_text(col_words, band):
-            y_lo, y_hi = Y[band]
-            items = [(w[0], w[1], w[4]) for w in col_words if y_lo <= w[1] < y_hi]
-            items.sort(key=lambda t: (t[0], -t[1]))  # x asc, y desc for wraps
-            return ' '.join(t for _, _, t in items)
-
-        questions = []
-        for i, cx in enumerate(col_xs):
-            col = [w for w in words if (cx - 1) <= w[0] < (boundaries[i+1] - 1)]
-
-            # Question text: skip the leading lfdNr digit at y≈739
-            qw = [(w[0], w[1], w[4]) for w in col
-                  if 410 <= w[1] < 740 and not (w[1] > 730 and w[4].isdigit())]
-            qw.sort(key=lambda t: (t[0], -t[1]))
-            q_text = ' '.join(t for _, _, t in qw).strip()
-
-            a = section_text(col, 'a')
-            b = section_text(col, 'b')
-            c = section_text(col, 'c')
-
-            if q_text and a:
-                questions.append({
-                    'question_de': clean_text(q_text),
-                    'ans_a_de': clean_text(a),
-                    'ans_b_de': clean_text(b),
-                    'ans_c_de': clean_text(c),
-                })
-
-        return questions
-
-    all_q = []
-    for pg in range(1, len(doc)):  # skip page 1 (overview)
-        all_q.extend(parse_page(doc[pg]))
-    return all_q
+    with fitz.open(pdf_path) as doc:
+        page_count = len(doc)
+
+    # Pages are independent and parsing is CPU-bound, so spread them over
+    # worker processes. Documents don't pickle: each worker opens its own.
+    with multiprocessing.Pool(initializer=_open_worker_doc, initargs=(pdf_path,)) as pool:
+        results = pool.map(_parse_page_number, range(1, page_count))  # skip page 1 (overview)
+
+    all_q = list(chain.from_iterable(results))
+    return {f: [q[k] for q in all_q] for k, f in enumerate(FIELDS_DE)}
 
 
 # ---------------------------------------------------------------------------
@@ -103,13 +146,18 @@ def translate_batch(texts, api_key, retries=3):
     params = urllib.parse.urlencode({'key': api_key})
     body = json.dumps({'q': texts, 'source': 'de', 'target': 'en', 'format': 'text'}).encode()
     req = urllib.request.Request(
-        f'{url}?{params}', data=body,
-        headers={'Content-Type': 'application/json'}
+        f'{url}?{params}', data=gzip.compress(body),
+        headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip',
+                 'Accept-Encoding': 'gzip'}
     )
     for attempt in range(retries):
         try:
             with urllib.request.urlopen(req, timeout=30) as resp:
-                result = json.loads(resp.read())
+                # Parse straight from the (possibly gzipped) response stream
+                stream = resp
+                if resp.headers.get('Content-Encoding') == 'gzip':
+                    stream = gzip.GzipFile(fileobj=resp)
+                result = json.load(stream)
                 return [t['translatedText'] for t in result['data']['translations']]
         except Exception as e:
             if attempt == retries - 1:
@@ -118,25 +166,55 @@ def translate_batch(texts, api_key, retries=3):
             time.sleep(2)
 
 
-def translate_all(questions, api_key):
-    fields_de = ['question_de', 'ans_a_de', 'ans_b_de', 'ans_c_de']
-    fields_en = ['question_en', 'ans_a_en', 'ans_b_en', 'ans_c_en']
-
-    all_texts = [q[f] for q in questions for f in fields_de]
-    translated = []
-
-    batch_size = 100
-    total_batches = (len(all_texts) + batch_size - 1) // batch_size
-    for i in range(0, len(all_texts), batch_size):
-        batch_num = i // batch_size + 1
-        print(f"  Translating batch {batch_num}/{total_batches}...")
-        translated.extend(translate_batch(all_texts[i:i+batch_size], api_key))
-
-    idx = 0
-    for q in questions:
-        for f_en in fields_en:
-            q[f_en] = translated[idx]
-            idx += 1
+def cache_key(text):
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def save_cache(cache, cache_path):
+    # Write then rename, so an interrupted run can't leave a truncated cache
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, indent=0)
+    os.replace(tmp_path, cache_path)
+
+
+def translate_all(questions, api_key, cache_path=None):
+    n = len(questions['question_de'])
+    all_texts = [t for f in FIELDS_DE for t in questions[f]]
+    keys = [cache_key(t) for t in all_texts]
+
+    # Translations from previous runs, keyed by hash of the German text
+    cache = {}
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+    cache.setdefault(cache_key(''), '')  # empty answers need no request
+    cached = sum(k in cache for k in keys)
+    # Each distinct string is sent once; many answers ("Ja", "Nein", ...) repeat
+    missing = list(dict.fromkeys(t for t, k in zip(all_texts, keys) if k not in cache))
+    print(f"  {cached} cached, {len(missing)} distinct strings to translate")
+
+    batch_size = 128  # API maximum of q entries per request
+    batches = [missing[i:i+batch_size] for i in range(0, len(missing), batch_size)]
+
+    # Requests are network-bound, so overlap them; map() keeps batch order.
+    try:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = ex.map(lambda batch: translate_batch(batch, api_key), batches)
+            for batch_num, (batch, result) in enumerate(zip(batches, results), 1):
+                print(f"  Translated batch {batch_num}/{len(batches)}")
+                for de, en in zip(batch, result):
+                    cache[cache_key(de)] = en
+    finally:
+        # Keep what was translated even if a later batch failed, so the next
+        # run only retries the rest
+        if cache_path and missing:
+            save_cache(cache, cache_path)
+
+    translated = [cache[k] for k in keys]
+
+    for k, f_en in enumerate(FIELDS_EN):
+        questions[f_en] = translated[k*n:(k+1)*n]
 
     return questions
 
@@ -314,7 +392,8 @@ body {
   line-height: 1.5;
   display: none;
 }
-.question-text-en.show { display: block; }
+/* Translations are revealed together via one class on the quiz screen */
+.show-trans .question-text-en { display: block; }
 
 .translate-btn {
   display: flex; align-items: center; gap: 8px;
@@ -363,7 +442,7 @@ body {
 .answer-body { flex: 1; }
 .answer-text-de { font-size: 16px; font-weight: 500; line-height: 1.4; }
 .answer-text-en { font-size: 13px; color: var(--text-muted); margin-top: 4px; display: none; line-height: 1.4; }
-.answer-text-en.show { display: block; }
+.show-trans .answer-text-en { display: block; }
 
 .answer-btn.correct {
   border-color: var(--correct);
@@ -725,11 +804,15 @@ body {
 <!-- Tooltip -->
 <div id="tooltip" style="display:none;"></div>
 
+<script id="questions-data" type="application/json">__QUESTIONS_JSON__</script>
 <script>
 // ═══════════════════════════════════════════════════════
 // DATA
 // ═══════════════════════════════════════════════════════
-const QUESTIONS = __QUESTIONS_JSON__;
+// Column-wise ({field: [values...]}), read by question index: QUESTIONS.ans_a_de[i].
+// Kept in a JSON block: JSON.parse is cheaper than parsing it as a JS literal.
+const QUESTIONS = JSON.parse(document.getElementById('questions-data').textContent);
+const QUESTION_COUNT = QUESTIONS.question_de.length;
 
 // ═══════════════════════════════════════════════════════
 // STORAGE
@@ -748,6 +831,43 @@ const S = {
   set wc(v)     { this._set('fs_wc', v); },
 };
 
+// In-memory mirror of everything in S, loaded once: reads never touch
+// localStorage or JSON.parse. After changing a field, call schedulePersist(key).
+const STORE = {
+  seen:   new Set(S.seen),                    // seen question indices
+  wrong:  new Set(S.wrong),                   // booklet question indices
+  wc:     new Map(Object.entries(S.wc)),      // word → translation
+  apiKey: S.apiKey,
+};
+const SERIALIZE = {
+  seen:   v => [...v],
+  wrong:  v => [...v],
+  wc:     v => Object.fromEntries(v),
+  apiKey: v => v,
+};
+
+// Coalesce writes: each changed key is serialized and stored once per idle
+// period (or 500 ms where requestIdleCallback is missing, e.g. iOS Safari).
+const dirtyKeys = new Set();
+function schedulePersist(key) {
+  if (dirtyKeys.size === 0) {
+    if (typeof requestIdleCallback === 'function') requestIdleCallback(flushPersist, { timeout: 500 });
+    else setTimeout(flushPersist, 500);
+  }
+  dirtyKeys.add(key);
+}
+
+function flushPersist() {
+  for (const key of dirtyKeys) S[key] = SERIALIZE[key](STORE[key]);
+  dirtyKeys.clear();
+}
+
+// Don't lose a pending write when the app is backgrounded or closed
+window.addEventListener('pagehide', flushPersist);
+document.addEventListener('visibilitychange', () => {
+  if (document.visibilityState === 'hidden') flushPersist();
+});
+
 // ═══════════════════════════════════════════════════════
 // APP STATE
 // ═══════════════════════════════════════════════════════
@@ -759,7 +879,32 @@ let state = {
   showTrans: false,
   sessionCorrect: 0,
   sessionWrong: 0,
-  shuffledAnswers: [], // [{text_de, text_en, correct}]
+  shuffledAnswers: [], // [{html_de, text_en, correct}]
+  answerButtons: [],   // buttons of the current question, same order
+};
+
+// ═══════════════════════════════════════════════════════
+// DOM REFERENCES (looked up once; the script runs after the markup)
+// ═══════════════════════════════════════════════════════
+const $ = id => document.getElementById(id);
+const DOM = {
+  progress:     $('quiz-progress'),
+  progressFill: $('progress-fill'),
+  questionMeta: $('question-meta'),
+  questionText: $('question-text'),
+  quizScreen:   $('screen-quiz'),
+  questionEn:   $('question-text-en'),
+  transBtn:     $('translate-btn'),
+  transLabel:   $('translate-btn-label'),
+  answersList:  $('answers-list'),
+  feedback:     $('feedback-bar'),
+  nextBtn:      $('next-btn'),
+  doneIcon:     $('done-icon'),
+  doneTitle:    $('done-title'),
+  doneSub:      $('done-sub'),
+  doneCorrect:  $('done-correct'),
+  doneWrong:    $('done-wrong'),
+  tooltip:      $('tooltip'),
 };
 
 // ═══════════════════════════════════════════════════════
@@ -781,41 +926,44 @@ function goHome() {
 // HOME
 // ═══════════════════════════════════════════════════════
 function refreshHome() {
-  const seen = S.seen;
-  const wrong = S.wrong;
-  const unseen = QUESTIONS.length - seen.length;
-
-  document.getElementById('stat-total').textContent = QUESTIONS.length;
-  document.getElementById('stat-seen').textContent = seen.length;
-  document.getElementById('stat-wrong').textContent = wrong.length;
-  document.getElementById('booklet-badge').textContent = wrong.length;
+  const seen = STORE.seen.size;
+  const wrong = STORE.wrong.size;
+  const unseen = QUESTION_COUNT - seen;
+
+  document.getElementById('stat-total').textContent = QUESTION_COUNT;
+  document.getElementById('stat-seen').textContent = seen;
+  document.getElementById('stat-wrong').textContent = wrong;
+  document.getElementById('booklet-badge').textContent = wrong;
   document.getElementById('btn-learn-desc').textContent =
-    unseen > 0 ? `${unseen} ungesehen · ${seen.length} gesehen` : 'Alle Fragen gesehen';
+    unseen > 0 ? `${unseen} ungesehen · ${seen} gesehen` : 'Alle Fragen gesehen';
 
   const bookletBtn = document.getElementById('btn-booklet');
-  bookletBtn.style.opacity = wrong.length === 0 ? '0.5' : '1';
+  bookletBtn.style.opacity = wrong === 0 ? '0.5' : '1';
 }
 
 // ═══════════════════════════════════════════════════════
 // SETTINGS
 // ═══════════════════════════════════════════════════════
 function refreshSettings() {
-  document.getElementById('api-key-input').value = S.apiKey;
-  const seen = S.seen.length;
+  document.getElementById('api-key-input').value = STORE.apiKey;
+  const seen = STORE.seen.size;
   document.getElementById('settings-stats').textContent =
-    `${seen} von ${QUESTIONS.length} Fragen gesehen · ${S.wrong.length} im Merkheft · ${Object.keys(S.wc).length} Wörter gecacht`;
+    `${seen} von ${QUESTION_COUNT} Fragen gesehen · ${STORE.wrong.size} im Merkheft · ${STORE.wc.size} Wörter gecacht`;
 }
 
 function saveSettings() {
   const key = document.getElementById('api-key-input').value.trim();
-  S.apiKey = key;
+  STORE.apiKey = key;
+  schedulePersist('apiKey');
   showToast('Gespeichert ✓');
 }
 
 function confirmReset() {
   if (confirm('Gesamten Fortschritt zurücksetzen? (Gesehen-Liste und Merkheft werden gelöscht)')) {
-    S.seen = [];
-    S.wrong = [];
+    STORE.seen.clear();
+    STORE.wrong.clear();
+    schedulePersist('seen');
+    schedulePersist('wrong');
     showToast('Fortschritt zurückgesetzt');
     refreshSettings();
   }
@@ -823,7 +971,8 @@ function confirmReset() {
 
 function confirmClearBooklet() {
   if (confirm('Merkheft leeren?')) {
-    S.wrong = [];
+    STORE.wrong.clear();
+    schedulePersist('wrong');
     showToast('Merkheft geleert');
     refreshSettings();
   }
@@ -833,9 +982,9 @@ function confirmClearBooklet() {
 // LEARN / BOOKLET START
 // ═══════════════════════════════════════════════════════
 function buildLearnQueue() {
-  const seen = new Set(S.seen);
+  const seen = STORE.seen;
   const unseen = [], seenArr = [];
-  QUESTIONS.forEach((_, i) => (seen.has(i) ? seenArr : unseen).push(i));
+  for (let i = 0; i < QUESTION_COUNT; i++) (seen.has(i) ? seenArr : unseen).push(i);
   shuffle(unseen);
   shuffle(seenArr);
   return [...unseen, ...seenArr];
@@ -854,10 +1003,9 @@ function startLearn() {
 }
 
 function startBooklet() {
-  const wrong = S.wrong;
-  if (wrong.length === 0) { showToast('Merkheft ist leer'); return; }
+  if (STORE.wrong.size === 0) { showToast('Merkheft ist leer'); return; }
   state.mode = 'booklet';
-  state.queue = shuffle([...wrong]);
+  state.queue = shuffle([...STORE.wrong]);
   state.current = 0;
   state.sessionCorrect = 0;
   state.sessionWrong = 0;
@@ -869,6 +1017,20 @@ function startBooklet() {
 // ═══════════════════════════════════════════════════════
 // QUIZ LOGIC
 // ═══════════════════════════════════════════════════════
+// All orderings of the three answers; one is picked uniformly per question
+const ANSWER_PERMS = [[0, 1, 2], [0, 2, 1], [1, 0, 2], [1, 2, 0], [2, 0, 1], [2, 1, 0]];
+
+// A question's wrapped markup never changes: build it on first display only
+const WRAPPED = [];
+function wrappedHtml(qIdx) {
+  return WRAPPED[qIdx] ??= {
+    question: wrapWords(QUESTIONS.question_de[qIdx]),
+    a: wrapWords(QUESTIONS.ans_a_de[qIdx]),
+    b: wrapWords(QUESTIONS.ans_b_de[qIdx]),
+    c: wrapWords(QUESTIONS.ans_c_de[qIdx]),
+  };
+}
+
 function showQuestion() {
   if (state.current >= state.queue.length) {
     showCompletion();
@@ -879,71 +1041,74 @@ function showQuestion() {
   state.showTrans = false;
 
   const qIdx = state.queue[state.current];
-  const q = QUESTIONS[qIdx];
+  const html = wrappedHtml(qIdx);
+  const questionEn = QUESTIONS.question_en[qIdx] || '';
 
   // Shuffle answers (correct is always ans_a)
-  state.shuffledAnswers = shuffle([
-    { text_de: q.ans_a_de, text_en: q.ans_a_en || '', correct: true },
-    { text_de: q.ans_b_de, text_en: q.ans_b_en || '', correct: false },
-    { text_de: q.ans_c_de, text_en: q.ans_c_en || '', correct: false },
-  ]);
+  const answers = [
+    { html_de: html.a, text_en: QUESTIONS.ans_a_en[qIdx] || '', correct: true },
+    { html_de: html.b, text_en: QUESTIONS.ans_b_en[qIdx] || '', correct: false },
+    { html_de: html.c, text_en: QUESTIONS.ans_c_en[qIdx] || '', correct: false },
+  ];
+  const p = ANSWER_PERMS[Math.random() * 6 | 0];
+  state.shuffledAnswers = [answers[p[0]], answers[p[1]], answers[p[2]]];
 
   // Progress
   const total = state.queue.length;
   const pos = state.current + 1;
-  document.getElementById('quiz-progress').textContent =
-    `Frage ${pos} von ${total}`;
-  document.getElementById('progress-fill').style.width = `${(pos / total) * 100}%`;
-  document.getElementById('question-meta').textContent =
+  DOM.progress.textContent = `Frage ${pos} von ${total}`;
+  DOM.progressFill.style.width = `${(pos / total) * 100}%`;
+  DOM.questionMeta.textContent =
     state.mode === 'booklet' ? '📕 Merkheft' : `Frage ${qIdx + 1}`;
 
   // Question text (words clickable)
-  document.getElementById('question-text').innerHTML = wrapWords(q.question_de);
-  const enEl = document.getElementById('question-text-en');
-  enEl.textContent = q.question_en || '';
-  enEl.classList.remove('show');
+  DOM.questionText.innerHTML = html.question;
+  DOM.questionEn.textContent = questionEn;
+  DOM.quizScreen.classList.remove('show-trans');
 
   // Translate button
-  const transBtn = document.getElementById('translate-btn');
-  transBtn.classList.remove('active');
-  document.getElementById('translate-btn-label').textContent = 'Übersetzen';
-  transBtn.style.display = q.question_en ? 'flex' : 'none';
+  DOM.transBtn.classList.remove('active');
+  DOM.transLabel.textContent = 'Übersetzen';
+  DOM.transBtn.style.display = questionEn ? 'flex' : 'none';
 
-  // Answers
+  // Answers: one markup string, one parse (clicks are delegated, see below)
   const letters = ['A', 'B', 'C'];
-  const list = document.getElementById('answers-list');
-  list.innerHTML = '';
-  state.shuffledAnswers.forEach((ans, i) => {
-    const btn = document.createElement('button');
-    btn.className = 'answer-btn';
-    btn.dataset.idx = i;
-    btn.onclick = () => selectAnswer(i);
-    btn.innerHTML = `
+  const list = DOM.answersList;
+  list.innerHTML = state.shuffledAnswers.map((ans, i) => `
+    <button class="answer-btn" data-idx="${i}">
       <div class="answer-letter">${letters[i]}</div>
       <div class="answer-body">
-        <div class="answer-text-de">${wrapWords(ans.text_de)}</div>
-        <div class="answer-text-en">${ans.text_en || ''}</div>
-      </div>`;
-    list.appendChild(btn);
+        <div class="answer-text-de">${ans.html_de}</div>
+        <div class="answer-text-en"></div>
+      </div>
+    </button>`).join('');
+  state.answerButtons = [...list.children];
+  // Translations are plain text: set them without going through the HTML parser
+  state.answerButtons.forEach((btn, i) => {
+    btn.querySelector('.answer-text-en').textContent = state.shuffledAnswers[i].text_en;
   });
 
   // Reset feedback
-  const fb = document.getElementById('feedback-bar');
-  fb.className = 'feedback-bar';
-  fb.textContent = '';
-  document.getElementById('next-btn').classList.remove('show');
+  DOM.feedback.className = 'feedback-bar';
+  DOM.feedback.textContent = '';
+  DOM.nextBtn.classList.remove('show');
   hideTooltip();
 }
 
+DOM.answersList.addEventListener('click', e => {
+  if (e.target.closest('.word')) return; // word lookups don't answer
+  const btn = e.target.closest('.answer-btn');
+  if (btn) selectAnswer(+btn.dataset.idx);
+});
+
 function selectAnswer(idx) {
   if (state.answered) return;
   state.answered = true;
 
   const ans = state.shuffledAnswers[idx];
   const qIdx = state.queue[state.current];
-  const buttons = document.querySelectorAll('.answer-btn');
 
-  buttons.forEach((btn, i) => {
+  state.answerButtons.forEach((btn, i) => {
     btn.disabled = true;
     if (state.shuffledAnswers[i].correct) {
       btn.classList.add('correct');
@@ -952,33 +1117,27 @@ function selectAnswer(idx) {
     }
   });
 
-  const fb = document.getElementById('feedback-bar');
+  const fb = DOM.feedback;
   if (ans.correct) {
     fb.className = 'feedback-bar correct';
     fb.textContent = '✓ Richtig!';
     state.sessionCorrect++;
     // Remove from wrong booklet if it was there
-    const wrong = S.wrong.filter(i => i !== qIdx);
-    S.wrong = wrong;
+    STORE.wrong.delete(qIdx);
   } else {
     fb.className = 'feedback-bar wrong';
     fb.textContent = '✗ Falsch – die richtige Antwort ist grün markiert.';
     state.sessionWrong++;
     // Add to wrong booklet
-    const wrong = S.wrong;
-    if (!wrong.includes(qIdx)) S.wrong = [...wrong, qIdx];
+    STORE.wrong.add(qIdx);
   }
 
   // Mark as seen
-  const seen = S.seen;
-  if (!seen.includes(qIdx)) S.seen = [...seen, qIdx];
+  STORE.seen.add(qIdx);
+  schedulePersist('seen');
+  schedulePersist('wrong');
 
-  document.getElementById('next-btn').classList.add('show');
-
-  // Auto-show English translations on answer reveal
-  if (state.showTrans) {
-    document.querySelectorAll('.answer-text-en').forEach(el => el.classList.add('show'));
-  }
+  DOM.nextBtn.classList.add('show');
 }
 
 function nextQuestion() {
@@ -988,17 +1147,10 @@ function nextQuestion() {
 
 function toggleTranslation() {
   state.showTrans = !state.showTrans;
-  const qIdx = state.queue[state.current];
-  const q = QUESTIONS[qIdx];
-
-  document.getElementById('question-text-en').classList.toggle('show', state.showTrans);
-  document.getElementById('translate-btn').classList.toggle('active', state.showTrans);
-  document.getElementById('translate-btn-label').textContent =
-    state.showTrans ? 'Ausblenden' : 'Übersetzen';
 
-  document.querySelectorAll('.answer-text-en').forEach(el =>
-    el.classList.toggle('show', state.showTrans)
-  );
+  DOM.quizScreen.classList.toggle('show-trans', state.showTrans);
+  DOM.transBtn.classList.toggle('active', state.showTrans);
+  DOM.transLabel.textContent = state.showTrans ? 'Ausblenden' : 'Übersetzen';
 }
 
 // ═══════════════════════════════════════════════════════
@@ -1008,13 +1160,13 @@ function showCompletion() {
   const total = state.sessionCorrect + state.sessionWrong;
   const pct = total > 0 ? Math.round((state.sessionCorrect / total) * 100) : 100;
 
-  document.getElementById('done-icon').textContent = pct >= 80 ? '🎉' : pct >= 50 ? '💪' : '📖';
-  document.getElementById('done-title').textContent =
+  DOM.doneIcon.textContent = pct >= 80 ? '🎉' : pct >= 50 ? '💪' : '📖';
+  DOM.doneTitle.textContent =
     state.mode === 'booklet' ? 'Merkheft abgeschlossen!' : 'Runde abgeschlossen!';
-  document.getElementById('done-sub').textContent =
+  DOM.doneSub.textContent =
     `${pct}% korrekt – ${state.sessionCorrect} richtig, ${state.sessionWrong} falsch.`;
-  document.getElementById('done-correct').textContent = state.sessionCorrect;
-  document.getElementById('done-wrong').textContent = state.sessionWrong;
+  DOM.doneCorrect.textContent = state.sessionCorrect;
+  DOM.doneWrong.textContent = state.sessionWrong;
 
   showScreen('done');
 }
@@ -1022,26 +1174,28 @@ function showCompletion() {
 // ═══════════════════════════════════════════════════════
 // WORD TRANSLATION TOOLTIP
 // ═══════════════════════════════════════════════════════
-function wrapWords(text) {
-  if (!text) return '';
-  return text.split(/(\s+)/).map(token => {
-    if (/^\s+$/.test(token)) return token;
-    const clean = token.replace(/^[.,!?;:()\[\]"']+|[.,!?;:()\[\]"']+$/g, '');
-    if (!clean || /^\d+$/.test(clean)) return token;
-    return `<span class="word" onclick="onWordClick(event, '${escAttr(clean)}')">${token}</span>`;
-  }).join('');
-}
+const WORD_SPLIT = /(\s+)/;
+const WORD_TRIM = /^[.,!?;:()\[\]"']+|[.,!?;:()\[\]"']+$/g;
+const DIGITS = /^\d+$/;
+const HAS_LETTER = /[A-Za-zÄÖÜäöüß]/;
 
-function escAttr(s) {
-  return s.replace(/'/g, "\\'").replace(/"/g, '&quot;');
+function wrapWords(text) {
+  if (!text || !HAS_LETTER.test(text)) return text || '';
+  // The capturing split alternates word, whitespace, word, ...
+  const tokens = text.split(WORD_SPLIT);
+  let html = '';
+  for (let i = 0; i < tokens.length; i++) {
+    const token = tokens[i];
+    const clean = i % 2 ? '' : token.replace(WORD_TRIM, '');
+    if (!clean || DIGITS.test(clean)) { html += token; continue; }
+    html += `<span class="word">${token}</span>`;
+  }
+  return html;
 }
 
 let activeWordEl = null;
 
-async function onWordClick(event, word) {
-  event.stopPropagation();
-  const el = event.currentTarget;
-
+async function onWordClick(el, word) {
   // Toggle off if same word
   if (activeWordEl === el) {
     hideTooltip();
@@ -1059,11 +1213,19 @@ async function onWordClick(event, word) {
   }
 }
 
+// Lookups still in flight, so repeated taps on a word share one request
+const PENDING = new Map();
+
 async function translateWordCached(word) {
-  const cache = S.wc;
-  if (cache[word]) return cache[word];
+  if (STORE.wc.has(word)) return STORE.wc.get(word);
+  if (!PENDING.has(word)) {
+    PENDING.set(word, fetchWordTranslation(word).finally(() => PENDING.delete(word)));
+  }
+  return PENDING.get(word);
+}
 
-  const apiKey = S.apiKey;
+async function fetchWordTranslation(word) {
+  const apiKey = STORE.apiKey;
   if (!apiKey) {
     showToast('Bitte API-Schlüssel in den Einstellungen eingeben');
     return null;
@@ -1075,9 +1237,8 @@ async function translateWordCached(word) {
     const data = await resp.json();
     if (data.error) { showToast('API-Fehler: ' + data.error.message); return null; }
     const result = data.data.translations[0].translatedText;
-    const updated = S.wc;
-    updated[word] = result;
-    S.wc = updated;
+    STORE.wc.set(word, result);
+    schedulePersist('wc');
     return result;
   } catch (e) {
     showToast('Übersetzungsfehler: ' + e.message);
@@ -1086,33 +1247,48 @@ async function translateWordCached(word) {
 }
 
 function showTooltipEl(el, text) {
-  const tip = document.getElementById('tooltip');
+  const tip = DOM.tooltip;
+  // Writes that affect the tooltip's size; keep it invisible until placed
   tip.textContent = text;
+  tip.style.visibility = 'hidden';
   tip.style.display = 'block';
-  tip.classList.remove('below');
 
+  // Reads, together: a single layout pass
   const rect = el.getBoundingClientRect();
   const tipW = tip.offsetWidth;
   const tipH = tip.offsetHeight;
+  const viewW = window.innerWidth;
 
   let top = rect.top - tipH - 10;
   let below = false;
   if (top < 8) { top = rect.bottom + 10; below = true; }
-  if (below) tip.classList.add('below');
 
   let left = rect.left + rect.width / 2;
-  left = Math.max(tipW / 2 + 8, Math.min(left, window.innerWidth - tipW / 2 - 8));
-
-  tip.style.top = top + 'px';
-  tip.style.left = left + 'px';
+  left = Math.max(tipW / 2 + 8, Math.min(left, viewW - tipW / 2 - 8));
+
+  // Positioning writes, batched into the next frame
+  requestAnimationFrame(() => {
+    tip.classList.toggle('below', below);
+    tip.style.top = top + 'px';
+    tip.style.left = left + 'px';
+    tip.style.visibility = 'visible';
+  });
 }
 
 function hideTooltip() {
-  document.getElementById('tooltip').style.display = 'none';
+  // Most taps happen with no tooltip open: skip the DOM writes then
+  if (!activeWordEl && DOM.tooltip.style.display === 'none') return;
+  DOM.tooltip.style.display = 'none';
   if (activeWordEl) { activeWordEl.classList.remove('active'); activeWordEl = null; }
 }
 
-document.addEventListener('click', hideTooltip);
+// One delegated handler: a tap on a word shows its translation, any other
+// tap closes the tooltip.
+document.addEventListener('click', e => {
+  const el = e.target.closest('.word');
+  if (el) onWordClick(el, el.textContent.replace(WORD_TRIM, ''));
+  else hideTooltip();
+}, { passive: true });
 
 // ═══════════════════════════════════════════════════════
 // UTILITIES
@@ -1160,9 +1336,34 @@ if ('serviceWorker' in navigator) {
 """
 
 
+_RE_INLINE_BLOCK = re.compile(r'(<(script|style)>)(.*?)(</\2>)', re.S)
+_RE_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+
+
+def minify_app(html):
+    """Strip comments, indentation and blank lines from inline <style>/<script>.
+
+    Deliberately line-based: newlines are kept, so automatic semicolon
+    insertion and multi-line template literals behave as in the source. Only
+    whole-line // comments are dropped; the JSON data block (which has
+    attributes on its <script> tag) is left alone.
+    """
+    def shrink(m):
+        open_tag, tag, body, close_tag = m.groups()
+        if tag == 'style':
+            body = _RE_CSS_COMMENT.sub('', body)
+        lines = (line.strip() for line in body.split('\n'))
+        body = '\n'.join(line for line in lines
+                         if line and not (tag == 'script' and line.startswith('//')))
+        return f'{open_tag}\n{body}\n{close_tag}'
+    return _RE_INLINE_BLOCK.sub(shrink, html)
+
+
 def build_html(questions):
     questions_json = json.dumps(questions, ensure_ascii=False, separators=(',', ':'))
-    return APP_HTML.replace('__QUESTIONS_JSON__', questions_json)
+    # Keep the data from closing its <script> block early
+    questions_json = questions_json.replace('</', '<\\/')
+    return minify_app(APP_HTML).replace('__QUESTIONS_JSON__', questions_json)
 
 
 def build_manifest():
@@ -1222,6 +1423,22 @@ def build_icon():
 # Main
 # ---------------------------------------------------------------------------
 
+def write_if_changed(path, content):
+    """Write content to path unless the file already holds exactly that.
+
+    Keeps mtimes stable on reruns so the PWA update check and file watchers
+    are not triggered by identical output. Returns True if written.
+    """
+    data = content.encode('utf-8')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print(__doc__)
@@ -1231,33 +1448,29 @@ if __name__ == '__main__':
     project_dir = os.path.dirname(script_dir)
     pdf_path = os.path.join(project_dir, 'Brandenburg_Fischereischein_Exam_Question_Bank.pdf')
     output_path = os.path.join(project_dir, 'index.html')
+    cache_path = os.path.join(project_dir, 'translations_cache.json')
 
     print(f"Parsing PDF: {pdf_path}")
     questions = parse_pdf(pdf_path)
-    print(f"  Found {len(questions)} questions")
+    n = len(questions['question_de'])
+    print(f"  Found {n} questions")
 
     if sys.argv[1] == '--no-translate':
         print("Skipping translation (--no-translate)")
-        for q in questions:
-            q['question_en'] = ''
-            q['ans_a_en'] = ''
-            q['ans_b_en'] = ''
-            q['ans_c_en'] = ''
+        for f in FIELDS_EN:
+            questions[f] = [''] * n
     else:
         api_key = sys.argv[1]
-        print(f"Translating {len(questions) * 4} strings via Google Translate Basic v2...")
+        print(f"Translating {n * 4} strings via Google Translate Basic v2...")
         try:
-            questions = translate_all(questions, api_key)
+            questions = translate_all(questions, api_key, cache_path)
             print("  Translation complete")
         except urllib.error.HTTPError as e:
             body = e.read().decode()
             print(f"  Translation API error {e.code}: {body}")
             print("  Falling back to untranslated mode")
-            for q in questions:
-                q.setdefault('question_en', '')
-                q.setdefault('ans_a_en', '')
-                q.setdefault('ans_b_en', '')
-                q.setdefault('ans_c_en', '')
+            for f in FIELDS_EN:
+                questions.setdefault(f, [''] * n)
 
     print("Building app files...")
     files = {
@@ -1266,14 +1479,12 @@ if __name__ == '__main__':
         os.path.join(project_dir, 'sw.js'):          build_sw(),
         os.path.join(project_dir, 'icon.svg'):       build_icon(),
     }
-    for path, content in files.items():
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+    written = {path: write_if_changed(path, content) for path, content in files.items()}
 
     size_kb = os.path.getsize(output_path) / 1024
     print(f"\n✓ Generated:")
-    for path in files:
-        print(f"  {os.path.basename(path)}")
+    for path, changed in written.items():
+        print(f"  {os.path.basename(path)}{'' if changed else ' (unchanged)'}")
     print(f"\n  index.html is {size_kb:.0f} KB")
     print(f"\nNext: push to GitHub and enable GitHub Pages.")
     print(f"Then open the Pages URL in Safari → Share → Add to Home Screen.")